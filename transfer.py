@@ -1,17 +1,81 @@
 #!/usr/bin/env python3
 
 import argparse
-import sqlite3
+import mmap
+import os
+import re
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from pathlib import Path
 import logging
 from datetime import datetime
 
+from utils._sqlite import apply_schema, connect
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
 )
 logger = logging.getLogger(__name__)
 
+# Fixed rsync options; the archive flag (-a/-av), LAN options and paths are per instance
+_RSYNC_FAST = (
+    "--partial",
+    "--info=stats2,misc0,flist0",
+    "--preallocate",
+    "--inplace",
+    "--numeric-ids",
+)
+# Skip the delta algorithm and compression when bandwidth is cheap
+_RSYNC_LAN = ("--whole-file", "--no-compress")
+# Compress over slow links; rsync only uses deltas for remote targets
+_RSYNC_WAN = ("--compress",)
+_RSYNC_VERIFY = (
+    "--partial",
+    "--info=stats2,misc0,flist0",
+    "--numeric-ids",
+    "--inplace",
+)
+
+# rsync prefixes every diagnostic line with "rsync:" or "rsync error:"
+_ERROR_PATTERN = re.compile(rb"^rsync(?: error)?:", re.MULTILINE)
+
+
+def _format_size(num_bytes):
+    """
+    Format a byte count in the style of `du -h`.
+
+    Args:
+        num_bytes (int): Size in bytes
+
+    Returns:
+        str: Human-readable size (e.g., "512", "12K", "5.5G")
+    """
+    size = float(num_bytes)
+    for unit in ("", "K", "M", "G", "T"):
+        if size < 1024:
+            break
+        size /= 1024
+    else:
+        unit = "P"
+    if not unit:
+        return str(num_bytes)
+    return f"{size:.1f}{unit}" if size < 10 else f"{size:.0f}{unit}"
+
+
+def _timestamp(dt):
+    """
+    Format a datetime as the "MM/DD/YYYY HH:MM:SS" prefix used in transfer logs.
+
+    Args:
+        dt (datetime): Time to format
+
+    Returns:
+        str: Formatted timestamp
+    """
+    return dt.strftime("%m/%d/%Y %H:%M:%S")
+
 
 class DataTransfer:
     """
@@ -24,7 +88,7 @@ class DataTransfer:
     All transfers are logged to SQLite database with status tracking.
     """
 
-    def __init__(self, source, target, max_retries=5):
+    def __init__(self, source, target, max_retries=5, verbose=False, lan=True):
         """
         Initialize DataTransfer instance.
 
@@ -32,12 +96,34 @@ class DataTransfer:
             source (str): Source directory path to transfer from
             target (str): Target directory path to transfer to
             max_retries (int): Maximum number of retry attempts (default: 5)
+            verbose (bool): Log one line per transferred file (rsync -v)
+                (default: False)
+            lan (bool): Use --whole-file and --no-compress for the initial pass;
+                disable on slow links to pass --compress instead and, for
+                remote targets, let rsync use its delta algorithm
+                (default: True)
         """
         self.source_path = Path(source).resolve()
         self.target_path = Path(target)
+        self.is_remote_target = ":" in str(target).split("/", 1)[0]
         self.max_retries = max_retries
+        self.archive_flag = "-av" if verbose else "-a"
         self.run_id = self.target_path.name
         self.target_run_dir = self.target_path / self.run_id
+        self.source_str = str(self.source_path)
+        self.target_str = str(self.target_path) + "/"
+        self.target_run_dir_str = str(self.target_run_dir) + "/"
+        self.rsync_cmd = [
+            "rsync",
+            self.archive_flag,
+            *_RSYNC_FAST,
+            *(_RSYNC_LAN if lan else _RSYNC_WAN),
+            self.source_str,
+            self.target_str,
+        ]
+        self.verification_cmd = [
+            "rsync", self.archive_flag, *_RSYNC_VERIFY, self.source_str, self.target_str
+        ]
 
         script_dir = Path(__file__).resolve().parent
         self.logs_dir = script_dir / "logs"
@@ -46,62 +132,129 @@ class DataTransfer:
         self.db_dir.mkdir(exist_ok=True)
 
         self.db_path = self.db_dir / "data_transfer.db"
+        self._conn = self._connect()
         self._init_db()
 
+    def _connect(self):
+        """
+        Open a connection to the transfer database.
+
+        The connection is tuned with the shared PRAGMAs (WAL,
+        synchronous=NORMAL, busy_timeout) so each status commit is a
+        cheap WAL append and status readers are not blocked. It is opened
+        in autocommit mode and kept for the lifetime of the instance.
+
+        Returns:
+            sqlite3.Connection: Database connection object
+        """
+        return connect(self.db_path, isolation_level=None)
+
+    def close(self):
+        """
+        Close the instance's database connection.
+        """
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Group database writes into a single BEGIN IMMEDIATE/COMMIT transaction.
+
+        Rolls back if the block raises. Several writes issued inside one
+        block share one commit; e.g. batched rows can be flushed with
+        executemany inside a single transaction.
+
+        Yields:
+            sqlite3.Connection: The instance's database connection
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
     def _init_db(self):
         """
         Initialize SQLite database for transfer status tracking.
 
         Creates the 'run' table if it doesn't exist with columns for
         run_id, transfer_date, transfer_time, source_dir, target_dir,
-        status, and log_path.
+        status, and log_path, plus the indexes backing the status
+        queries (date/time ordering, with or without a status filter).
+        The DDL is shared with the utils scripts via
+        utils._sqlite.SCHEMA_SQL.
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("""CREATE TABLE IF NOT EXISTS run (
-            run_id TEXT PRIMARY KEY, transfer_date TEXT,
-            transfer_time TEXT, source_dir TEXT,
-            target_dir TEXT, status TEXT,
-            log_path TEXT
-        )""")
-        conn.commit()
-        conn.close()
+        apply_schema(self._conn)
 
     def _update_status(self, status, **kwargs):
         """
-        Update transfer status in the database.
+        Update transfer status in the database in its own transaction.
 
         Args:
             status (str): Transfer status (PROCESSING, SUCCESS, FAILED)
             **kwargs: Additional fields for database update (date, time, source,
                     target, log_path) - required when status is PROCESSING
         """
-        conn = sqlite3.connect(str(self.db_path))
-        try:
-            if status == "PROCESSING":
-                conn.execute(
-                    """INSERT OR REPLACE INTO run (
-                            run_id, transfer_date,
-                            transfer_time, source_dir,
-                            target_dir, status,
-                            log_path) 
-                            VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        self.run_id,
-                        kwargs["date"],
-                        kwargs["time"],
-                        kwargs["source"],
-                        kwargs["target"],
-                        status,
-                        kwargs["log_path"],
-                    ),
-                )
-            else:
-                conn.execute(
-                    "UPDATE run SET status = ? WHERE run_id = ?", (status, self.run_id)
-                )
-            conn.commit()
-        finally:
-            conn.close()
+        with self._transaction():
+            self._write_status(status, **kwargs)
+
+    def _claim_run(self, **kwargs):
+        """
+        Mark the run PROCESSING unless it is already taken.
+
+        The status lookup and the PROCESSING insert share one BEGIN
+        IMMEDIATE transaction, so two transfers with the same run_id
+        (parallel jobs or overlapping cron invocations) cannot both claim
+        the run.
+
+        Args:
+            **kwargs: Fields for the PROCESSING row (date, time, source,
+                    target, log_path)
+
+        Returns:
+            str or None: Existing status if the run is SUCCESS or
+                PROCESSING, None if this instance claimed it
+        """
+        with self._transaction():
+            current_status = self._get_current_status()
+            if current_status in ("SUCCESS", "PROCESSING"):
+                return current_status
+            self._write_status("PROCESSING", **kwargs)
+        return None
+
+    def _write_status(self, status, **kwargs):
+        """
+        Write the run's status; the caller owns the transaction.
+
+        Args:
+            status (str): Transfer status (PROCESSING, SUCCESS, FAILED)
+            **kwargs: Additional fields for database update (date, time, source,
+                    target, log_path) - required when status is PROCESSING
+        """
+        if status == "PROCESSING":
+            self._conn.execute(
+                """INSERT OR REPLACE INTO run (
+                        run_id, transfer_date,
+                        transfer_time, source_dir,
+                        target_dir, status,
+                        log_path) 
+                        VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    self.run_id,
+                    kwargs["date"],
+                    kwargs["time"],
+                    kwargs["source"],
+                    kwargs["target"],
+                    status,
+                    kwargs["log_path"],
+                ),
+            )
+        else:
+            self._conn.execute(
+                "UPDATE run SET status = ? WHERE run_id = ?", (status, self.run_id)
+            )
 
     def _get_current_status(self):
         """
@@ -110,145 +263,201 @@ class DataTransfer:
         Returns:
             str or None: Current status of the run_id, None if not found
         """
-        conn = sqlite3.connect(str(self.db_path))
-        try:
-            cursor = conn.execute(
-                "SELECT status FROM run WHERE run_id = ?", (self.run_id,)
-            )
-            result = cursor.fetchone()
-            return result[0] if result else None
-        finally:
-            conn.close()
+        cursor = self._conn.execute(
+            "SELECT status FROM run WHERE run_id = ?", (self.run_id,)
+        )
+        result = cursor.fetchone()
+        return result[0] if result else None
 
     def _get_dir_size(self):
         """
-        Get human-readable size of source directory using du command.
+        Get human-readable size of source directory.
+
+        Walks the tree with os.scandir, summing file sizes from the cached
+        directory entries without following symlinks, instead of forking
+        `du -sh`.
 
         Returns:
-            str: Directory size (e.g., "5.5G") or "Unknown" if command fails
+            str: Directory size (e.g., "5.5G") or "Unknown" if the walk fails
         """
-        result = subprocess.run(
-            ["du", "-sh", str(self.source_path)], stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        return result.stdout.strip() if result.returncode == 0 else "Unknown"
+        total = 0
+        stack = [self.source_str]
+        try:
+            while stack:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            return "Unknown"
+        return _format_size(total)
+
+    def _log_has_errors(self, log_file_path, offset):
+        """
+        Scan the rsync output written to the log since offset for error markers.
+
+        The log is memory-mapped and searched once with _ERROR_PATTERN, so
+        rsync output never has to be held in Python memory.
+
+        Args:
+            log_file_path (Path): Log file the rsync passes wrote to
+            offset (int): Byte offset where this attempt's rsync output starts
+
+        Returns:
+            bool: True if any rsync diagnostic line appears in the output
+        """
+        with open(log_file_path, "rb") as log:
+            if os.fstat(log.fileno()).st_size <= offset:
+                return False
+            with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as output:
+                return _ERROR_PATTERN.search(output, offset) is not None
+
+    def _upload_log(self, log_file_path):
+        """
+        Copy the transfer log into target_run_dir.
+
+        Local targets get shutil.copy2 (kernel-side copy on Linux, keeping
+        mtime and permissions like rsync -a) after creating the directory.
+        Remote targets still need rsync, but with the delta algorithm and
+        compression turned off for this single small file.
+
+        Args:
+            log_file_path (Path): Log file to upload
+        """
+        if self.is_remote_target:
+            log_transfer_cmd = [
+                "rsync",
+                self.archive_flag,
+                "--whole-file",
+                "--inplace",
+                "--no-compress",
+                str(log_file_path),
+                self.target_run_dir_str,
+            ]
+            subprocess.run(
+                log_transfer_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            return
+        try:
+            self.target_run_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(log_file_path, self.target_run_dir / log_file_path.name)
+        except OSError as e:
+            logger.warning(f"Could not copy log for {self.run_id}: {e}")
 
     def run(self):
         """
         Execute the data transfer with retry logic and verification.
 
         The transfer process uses a two-stage approach:
-        1. Fast initial rsync with --whole-file, --inplace, --no-compress
+        1. Fast initial rsync with --inplace and --preallocate (plus
+           --whole-file and --no-compress in LAN mode, --compress otherwise)
         2. Verification rsync to catch errors.
 
         Only the verification result determines success/failure. The second pass
         detects and retransfers any files that failed or were partially
-        written during the first pass.
+        written during the first pass. When the target is local and the
+        destination directory did not exist before the run, a clean first
+        pass is trusted and the verification pass is skipped. Once the
+        initial pass has completed, later retries run only the
+        verification pass.
 
         Returns:
             str: Final transfer status ("SUCCESS", "FAILED", or existing status)
         """
-        current_status = self._get_current_status()
-        if current_status and current_status in ["SUCCESS", "PROCESSING"]:
-            logger.info(f"Skipping {self.run_id} with status {current_status}")
-            return current_status
-
-        dir_size = self._get_dir_size()
-        logger.info(f"Directory size: {dir_size}")
-
         now = datetime.now()
+        date_str = now.strftime("%m/%d/%Y")
+        time_str = now.strftime("%H:%M:%S")
+        ts = f"{date_str} {time_str}"
         log_filename = f"{self.run_id}_{now.strftime('%Y%m%d_%H%M%S')}.log"
         log_file_path = self.logs_dir / log_filename
 
-        self._update_status(
-            "PROCESSING",
-            date=now.strftime("%m/%d/%Y"),
-            time=now.strftime("%H:%M:%S"),
-            source=str(self.source_path),
+        current_status = self._claim_run(
+            date=date_str,
+            time=time_str,
+            source=self.source_str,
             target=str(self.target_path),
             log_path=str(log_file_path),
         )
+        if current_status:
+            logger.info(f"Skipping {self.run_id} with status {current_status}")
+            return current_status
+
+        # The size is informational only, so walk the tree alongside rsync
+        size_executor = ThreadPoolExecutor(max_workers=1)
+        size_future = size_executor.submit(self._get_dir_size)
+        size_executor.shutdown(wait=False)
 
         logger.info(f"Starting rsync for {self.run_id}")
-        rsync_cmd = [
-            "rsync",
-            "-avP",
-            "--whole-file",
-            "--no-compress",
-            "--inplace",
-            "--numeric-ids",
-            str(self.source_path),
-            str(self.target_path) + "/",
-        ]
-        verification_cmd = [
-            "rsync",
-            "-avP",
-            "--numeric-ids",
-            "--inplace",
-            str(self.source_path),
-            str(self.target_path) + "/",
-        ]
+        # Nothing stale or partial can exist under a fresh local destination
+        skip_verification = (
+            not self.is_remote_target
+            and not (self.target_path / self.source_path.name).exists()
+        )
+        dir_size = size_future.result() if size_future.done() else "pending"
+        logger.info(f"Directory size: {dir_size}")
         status = None
-        for attempt in range(1, self.max_retries + 1):
-            with open(log_file_path, "a" if attempt > 1 else "w") as log:
+        initial_done = False
+        # One log fd for the whole run; each rsync inherits it and appends
+        with open(log_file_path, "w", buffering=1 << 16) as log:
+            for attempt in range(1, self.max_retries + 1):
                 if attempt > 1:
                     log.write(
-                        f"\n{datetime.now().strftime('%m/%d/%Y')} {datetime.now().strftime('%H:%M:%S')} - Retry attempt {attempt} of {self.max_retries}\n"
+                        f"\n{_timestamp(datetime.now())} - Retry attempt {attempt} of {self.max_retries}\n"
                     )
                 else:
-                    log.write(
-                        f"{now.strftime('%m/%d/%Y')} {now.strftime('%H:%M:%S')} - Transfer started at: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                    )
-                    log.write(
-                        f"{now.strftime('%m/%d/%Y')} {now.strftime('%H:%M:%S')} - Source: {self.source_path}, Target: {self.target_path}\n"
-                    )
-                    log.write(
-                        f"{now.strftime('%m/%d/%Y')} {now.strftime('%H:%M:%S')} - Source directory size: {dir_size}\n"
-                    )
-                    log.write(
-                        f"{now.strftime('%m/%d/%Y')} {now.strftime('%H:%M:%S')} - Command: {' '.join(rsync_cmd)}\n"
-                    )
-
+                    log.writelines([
+                        f"{ts} - Transfer started at: {now.strftime('%Y-%m-%d %H:%M:%S')}\n",
+                        f"{ts} - Source: {self.source_path}, Target: {self.target_path}\n",
+                        f"{ts} - Source directory size: {dir_size}\n",
+                        f"{ts} - Command: {' '.join(self.rsync_cmd)}\n",
+                    ])
+
+                # Flush our lines before rsync starts writing to the same fd
                 log.flush()
-                result = subprocess.run(
-                    rsync_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
-                )
-                combined_output = result.stdout + result.stderr
-                log.write(combined_output)
-                log.flush()
-                result_verification = subprocess.run(
-                    verification_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
-                )
-                verification_output = result_verification.stdout + result_verification.stderr
-                log.write(verification_output)
-                log.flush()
-                end_time = datetime.now()
-                all_output = combined_output + verification_output
-                has_file_errors = (
-                    'failed:' in all_output or
-                    'rsync error:' in all_output or
-                    'error' in all_output.lower()
-                )
-                if result.returncode == 0 and result_verification.returncode == 0 and not has_file_errors:
+                output_start = os.fstat(log.fileno()).st_size
+                if initial_done:
+                    # The fast pass already completed; the verification pass
+                    # alone retransfers anything still missing or damaged
+                    returncode = 0
+                else:
+                    returncode = subprocess.run(
+                        self.rsync_cmd, stdout=log, stderr=subprocess.STDOUT
+                    ).returncode
+                    initial_done = returncode == 0
+                if skip_verification and attempt == 1 and returncode == 0:
+                    verification_ok = True
+                else:
+                    result_verification = subprocess.run(
+                        self.verification_cmd, stdout=log, stderr=subprocess.STDOUT
+                    )
+                    verification_ok = result_verification.returncode == 0
+                end_ts = _timestamp(datetime.now())
+                if (
+                    returncode == 0
+                    and verification_ok
+                    and not self._log_has_errors(log_file_path, output_start)
+                ):
                     log.write(
-                        f"{end_time.strftime('%m/%d/%Y')} {end_time.strftime('%H:%M:%S')} - Transfer completed successfully on attempt {attempt}\n"
+                        f"{end_ts} - Transfer completed successfully on attempt {attempt}\n"
                     )
                     status = "SUCCESS"
                     break
                 else:
                     log.write(
-                        f"{end_time.strftime('%m/%d/%Y')} {end_time.strftime('%H:%M:%S')} - Transfer failed on attempt {attempt}\n"
+                        f"{end_ts} - Transfer failed on attempt {attempt}\n"
                     )
                     if attempt < self.max_retries:
                         logger.warning(
                             f"{self.run_id} transfer failed on attempt {attempt}, retrying..."
                         )
 
+            if dir_size == "pending" and size_future.done():
+                log.write(
+                    f"{_timestamp(datetime.now())} - Source directory size: {size_future.result()}\n"
+                )
+
         if status != "SUCCESS":
             status = "FAILED"
             logger.error(
@@ -257,38 +466,147 @@ class DataTransfer:
 
         self._update_status(status)
 
-        log_transfer_cmd = [
-            "rsync",
-            "-avP",
-            "--update",
-            str(log_file_path),
-            str(self.target_run_dir) + "/",
-        ]
-
-        subprocess.run(log_transfer_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self._upload_log(log_file_path)
 
         return status
 
 
+def _transfer(source, target, max_retries, verbose, lan):
+    """
+    Run a single transfer and release its database connection.
+
+    Errors are logged with the source and reported as FAILED, so one
+    broken job does not abort the others or the final summary.
+
+    Args:
+        source (str): Source directory path to transfer from
+        target (str): Target directory path to transfer to
+        max_retries (int): Maximum number of retry attempts
+        verbose (bool): Log one line per transferred file
+        lan (bool): Use LAN-tuned rsync options for the initial pass
+
+    Returns:
+        str: Final transfer status
+    """
+    try:
+        with closing(
+            DataTransfer(source, target, max_retries, verbose, lan)
+        ) as transfer:
+            return transfer.run()
+    except Exception:
+        logger.exception(f"Transfer of {source} failed")
+        return "FAILED"
+
+
+def _read_sources_file(path, default_target):
+    """
+    Read transfer jobs from a sources file.
+
+    Each non-empty line holds a source directory, optionally followed by a
+    tab and its target directory. Lines without a target go to a directory
+    named after their source under default_target. The last component of a target is its run_id, so no two jobs may end in
+    the same directory name; they would otherwise skip or race each other.
+
+    Args:
+        path (str): Path to the sources file
+        default_target (str or None): Parent of the target used when a line
+            has none
+
+    Returns:
+        list: (source, target) tuples
+
+    Raises:
+        ValueError: If a line has no target and no default target is given,
+            or if two jobs share a run_id
+    """
+    jobs = []
+    run_ids = set()
+    with open(path) as sources:
+        for line in sources:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+            source, _, target = line.partition("\t")
+            if not target:
+                if not default_target:
+                    raise ValueError(f"No target given for source {source}")
+                target = str(Path(default_target) / Path(source).name)
+            run_id = Path(target).name
+            if run_id in run_ids:
+                raise ValueError(
+                    f"Duplicate run_id {run_id} for source {source}; "
+                    "each job needs its own target"
+                )
+            run_ids.add(run_id)
+            jobs.append((source, target))
+    return jobs
+
+
 def main():
     """
     Main entry point for command-line execution.
 
-    Parses command-line arguments and executes data transfer.
-    Exits with code 1 if transfer fails, 0 on success.
+    Parses command-line arguments and executes data transfer, either for a
+    single --source/--target pair or for every job in --sources-file, with up
+    to --parallel transfers running at once in a thread pool.
+    Exits with code 1 if any transfer fails, 0 on success. With
+    --sources-file, jobs skipped because their run is still PROCESSING are
+    also reported and exit with code 1; a single --source/--target run
+    that is already in progress exits 0, as cron re-runs expect.
     """
     parser = argparse.ArgumentParser()
-    parser.add_argument("--source", required=True)
-    parser.add_argument("--target", required=True)
+    parser.add_argument("--source")
+    parser.add_argument("--target")
+    parser.add_argument(
+        "--sources-file",
+        help="File with one source per line, optionally followed by a tab and its target",
+    )
+    parser.add_argument(
+        "--parallel", type=int, default=1, help="Maximum concurrent transfers"
+    )
     parser.add_argument(
         "--max-retries", type=int, default=5, help="Maximum number of retry attempts"
     )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Log every transferred file (rsync -v)"
+    )
+    parser.add_argument(
+        "--lan",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Use --whole-file/--no-compress for the initial pass (default: on); "
+        "--no-lan compresses instead and, for remote targets, uses rsync's deltas",
+    )
     args = parser.parse_args()
 
-    transfer = DataTransfer(args.source, args.target, args.max_retries)
-    status = transfer.run()
+    if args.sources_file:
+        try:
+            jobs = _read_sources_file(args.sources_file, args.target)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    elif args.source and args.target:
+        jobs = [(args.source, args.target)]
+    else:
+        parser.error("--source and --target are required without --sources-file")
+
+    with ThreadPoolExecutor(max_workers=max(1, args.parallel)) as executor:
+        statuses = list(
+            executor.map(
+                lambda job: _transfer(*job, args.max_retries, args.verbose, args.lan),
+                jobs,
+            )
+        )
+
+    # run() only returns PROCESSING when another transfer holds the run
+    skipped = [
+        source for (source, _), status in zip(jobs, statuses) if status == "PROCESSING"
+    ] if args.sources_file else []
+    if skipped:
+        logger.error(
+            f"Skipped {len(skipped)} job(s) still in progress: {', '.join(skipped)}"
+        )
 
-    if status == "FAILED":
+    if "FAILED" in statuses or skipped:
         exit(1)
 
 
@@ -0,0 +1 @@
+"""Helper scripts and shared SQLite setup for the transfer database."""
@@ -1,24 +1,22 @@
 #!/usr/bin/env python3
 
-import sqlite3
 import csv
 import sys
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
+
+try:
+    from ._sqlite import apply_schema, connect
+except ImportError:  # run as a script from utils/
+    from _sqlite import apply_schema, connect
+
+BATCH_SIZE = 10_000
 
 def init_db(db_path):
-    """Initialize database and create table if it doesn't exist"""
-    conn = sqlite3.connect(db_path)
-    conn.execute('''CREATE TABLE IF NOT EXISTS run (
-        run_id TEXT PRIMARY KEY,
-        transfer_date TEXT,
-        transfer_time TEXT,
-        source_dir TEXT,
-        target_dir TEXT,
-        status TEXT,
-        log_path TEXT
-    )''')
-    conn.commit()
+    """Initialize database and create table and indexes if they don't exist"""
+    conn = connect(db_path)
+    apply_schema(conn)
     return conn
 
 def main():
@@ -31,25 +29,31 @@ def main():
     
     # Read CSV and insert into database
     conn = init_db(db_path)
+    now = datetime.now()
+    transfer_date = now.strftime('%m/%d/%Y')
+    transfer_time = now.strftime('%H:%M:%S')
     
     with open(csv_file, 'r') as f:
         reader = csv.DictReader(f)
-        for row in reader:
-            now = datetime.now()
-            conn.execute("""
-                INSERT OR REPLACE INTO run (run_id, transfer_date, transfer_time, source_dir, target_dir, status, log_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                row['run_id'],
-                now.strftime('%m/%d/%Y'),
-                now.strftime('%H:%M:%S'),
-                "NA",
-                "NA",
-                "SUCCESS",
-                "NA"
-            ))
+        rows = (
+            (row['run_id'], transfer_date, transfer_time, "NA", "NA", "SUCCESS", "NA")
+            for row in reader
+        )
+        # Insert in bounded batches inside a single transaction
+        with conn:
+            while True:
+                batch = list(islice(rows, BATCH_SIZE))
+                if not batch:
+                    break
+                conn.executemany("""
+                    INSERT INTO run (run_id, transfer_date, transfer_time, source_dir, target_dir, status, log_path)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(run_id) DO UPDATE SET
+                        transfer_date = excluded.transfer_date,
+                        transfer_time = excluded.transfer_time,
+                        status = excluded.status
+                """, batch)
     
-    conn.commit()
     conn.close()
     print(f"Data imported from {csv_file}")
 
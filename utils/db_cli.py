@@ -1,8 +1,125 @@
 import argparse
+import contextlib
+import csv
+import functools
+import os
+import queue
 import sqlite3
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from ._sqlite import apply_schema, connect
+except ImportError:  # run as a script from utils/
+    from _sqlite import apply_schema, connect
+
+
+class _Pool:
+    """A process-wide pool of tuned SQLite connections keyed by database path.
+
+    Connections are handed out most-recently-used first so the page cache of
+    the returned connection is likely to still be warm.
+
+    Attributes:
+        size (int): Maximum number of idle connections kept per database path.
+    """
+
+    def __init__(self, size: int = 4):
+        """Initialize an empty pool.
+
+        Args:
+            size (int, optional): Idle connections kept per database. Defaults to 4.
+        """
+        self.size = size
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _slots(self, path: str):
+        """Return the idle-connection queue for path, creating it on first use.
+
+        Args:
+            path (str): Path to the SQLite database file.
+
+        Returns:
+            queue.LifoQueue: Idle connections for this database.
+        """
+        with self._lock:
+            if path not in self._idle:
+                self._idle[path] = queue.LifoQueue(maxsize=self.size)
+            return self._idle[path]
+
+    def acquire(self, path: str):
+        """Return an idle connection for path, opening and tuning a new one if needed.
+
+        Connections are opened in autocommit mode (isolation_level=None), so
+        callers that need a multi-statement transaction issue BEGIN/COMMIT
+        explicitly.
+
+        Args:
+            path (str): Path to the SQLite database file.
+
+        Returns:
+            sqlite3.Connection: Database connection object.
+        """
+        try:
+            return self._slots(path).get_nowait()
+        except queue.Empty:
+            return connect(path, isolation_level=None,
+                           check_same_thread=False)
+
+    def release(self, path: str, conn: sqlite3.Connection):
+        """Return a connection to the pool, closing it if the pool is full.
+
+        Args:
+            path (str): Path the connection was acquired for.
+            conn (sqlite3.Connection): Connection to give back.
+        """
+        try:
+            self._slots(path).put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+_pool = _Pool()
+
+DEFAULT_COLUMNS = (
+    "run_id",
+    "transfer_date",
+    "transfer_time",
+    "status",
+    "source_dir",
+    "target_dir",
+    "log_path",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_query(columns: tuple, where_clause: str, order_by: str, has_limit: bool):
+    """Build the SELECT statement for TransferDB.query().
+
+    Results are memoized so repeated queries reuse the identical SQL text,
+    which keeps SQLite's per-connection statement cache hot.
+
+    Args:
+        columns (tuple): Column names to select.
+        where_clause (str): SQL WHERE clause, or None.
+        order_by (str): SQL ORDER BY clause, or None.
+        has_limit (bool): Whether to append a bound LIMIT placeholder.
+
+    Returns:
+        str: The SQL string.
+    """
+    q = f"SELECT {', '.join(columns)} FROM run"
+    if where_clause:
+        q += f" WHERE {where_clause}"
+    if order_by:
+        q += f" ORDER BY {order_by}"
+    if has_limit:
+        q += " LIMIT ?"
+    return q
+
 
 class TransferDB:
     """A database interface class for managing transfer run records in SQLite.
@@ -13,6 +130,8 @@ class TransferDB:
         db_path (Path): Path object representing the SQLite database file location.
     """
 
+    _schema_applied = set()
+
     def __init__(self, sqlite_db: str):
         """Initialize the TransferDB instance with database path.
 
@@ -20,22 +139,68 @@ class TransferDB:
             sqlite_db (str): Path to the SQLite database file.
         """
         self.db_path = Path(sqlite_db)
+        self._db_str = os.fspath(self.db_path.expanduser())
 
     def _connect_db(self):
-        """Create and return a connection to the SQLite database.
+        """Acquire a connection to the SQLite database from the process-wide pool.
+
+        New connections are tuned with the shared PRAGMAs (WAL,
+        synchronous=NORMAL) once, when they are first opened. The schema is
+        applied on the first connection to each database in this process.
 
         Returns:
             sqlite3.Connection: Database connection object.
         """
-        conn = sqlite3.connect(str(self.db_path))
+        path = self._db_str
+        conn = _pool.acquire(path)
+        if path not in TransferDB._schema_applied:
+            apply_schema(conn)
+            TransferDB._schema_applied.add(path)
         return conn
 
+    def _release_db(self, conn: sqlite3.Connection):
+        """Give a connection obtained from _connect_db() back to the pool.
+
+        Args:
+            conn (sqlite3.Connection): Connection to release.
+        """
+        _pool.release(self._db_str, conn)
+
+    @contextlib.contextmanager
+    def _write_txn(self):
+        """Run a block of writes inside a BEGIN IMMEDIATE transaction.
+
+        Taking the write lock upfront avoids the deferred-to-exclusive lock
+        upgrade that makes concurrent CLI writers fail with SQLITE_BUSY.
+        The transaction is committed on success and rolled back on error.
+        If COMMIT or ROLLBACK itself fails, the transaction is still open,
+        so the connection is closed instead of going back to the pool.
+
+        Yields:
+            sqlite3.Connection: Database connection with an open transaction.
+        """
+        conn = self._connect_db()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            if conn.in_transaction:
+                conn.close()
+            else:
+                self._release_db(conn)
+
     def query(
         self,
         columns: list = None,
         limit: int = None,
         where_clause: str = None,
         order_by: str = "transfer_date DESC, transfer_time DESC",
+        params: tuple = (),
     ):
         """Query the run table with optional filtering, ordering, and limiting.
 
@@ -44,38 +209,30 @@ class TransferDB:
             limit (int, optional): Maximum number of rows to return. Defaults to None (no limit).
             where_clause (str, optional): SQL WHERE clause for filtering. Defaults to None.
             order_by (str, optional): SQL ORDER BY clause. Defaults to "transfer_date DESC, transfer_time DESC".
+            params (tuple, optional): Values bound to the ? placeholders in where_clause. Defaults to ().
 
         Returns:
             TransferDB: Self reference for method chaining.
 
         Example:
-            db.query(columns=['run_id', 'status'], limit=10, where_clause="status='SUCCESS'")
+            db.query(columns=['run_id', 'status'], limit=10, where_clause="status = ?", params=("SUCCESS",))
         """
-        conn = self._connect_db()
-        show_columns = [
-            "run_id",
-            "transfer_date",
-            "transfer_time",
-            "status",
-            "source_dir",
-            "target_dir",
-            "log_path",
-        ]
-        if columns:
-            show_columns = columns
-        select_cols = ", ".join(show_columns)
-        q = f"SELECT {select_cols} FROM run"
-        if where_clause:
-            q += f" WHERE {where_clause}"
-        if order_by:
-            q += f" ORDER BY {order_by}"
         if limit:
-            q += f" LIMIT {limit}"
-        cursor = conn.execute(q)
-        self.results = cursor.fetchall()
-        self.column_names = [description[0]
-                             for description in cursor.description]
-        conn.close()
+            params = (*params, limit)
+        q = _build_query(
+            tuple(columns) if columns else DEFAULT_COLUMNS,
+            where_clause,
+            order_by,
+            bool(limit),
+        )
+        conn = self._connect_db()
+        try:
+            cursor = conn.execute(q, params)
+            self.results = cursor.fetchall()
+            self.column_names = [description[0]
+                                 for description in cursor.description]
+        finally:
+            self._release_db(conn)
         return self
 
     def show(self, header: bool = False):
@@ -84,15 +241,16 @@ class TransferDB:
         Args:
             header (bool, optional): Whether to print column headers. Defaults to False.
 
+        Values are written with csv.writer, so non-text columns (e.g. NULL)
+        are handled and fields containing commas are quoted.
+
         Note:
             This method prints directly to stdout. This chained after the query() call.
         """
+        writer = csv.writer(sys.stdout, lineterminator="\n")
         if header:
-            header = ",".join(col for col in self.column_names)
-            print(header)
-        for row in self.results:
-            row_str = ",".join(val for val in row)
-            print(row_str)
+            writer.writerow(self.column_names)
+        writer.writerows(self.results)
 
     def update(self, run_id: str, **kwargs):
         """Update an existing run record with new values.
@@ -118,39 +276,32 @@ class TransferDB:
             db.update("run123", source_dir="/new/path", status="FAILED")
             db.update("run123", status="SUCCESS", transfer_date="09/25/2025")  # Update status and date
         """
-        conn = self._connect_db()
-        cursor = conn.execute("SELECT * FROM run WHERE run_id = ?", (run_id,))
-        existing_record = cursor.fetchone()
-
-        if existing_record:
-            set_clauses = []
-            params = []
-            valid_fields = {
-                "source_dir",
-                "target_dir",
-                "status",
-                "log_path",
-                "transfer_date",
-                "transfer_time",
-            }
-            for field, value in kwargs.items():
-                if field in valid_fields:
-                    set_clauses.append(f"{field} = ?")
-                    params.append(value)
-            if set_clauses:
-                params.append(run_id)
-                update_query = (
-                    f"UPDATE run SET {', '.join(set_clauses)} WHERE run_id = ?"
-                )
-                conn.execute(update_query, params)
-                conn.commit()
-                print(f"Updated record for run_id: {run_id}")
-            else:
-                print(
-                    f"No valid fields provided for update of run_id: {run_id}")
+        set_clauses = []
+        params = []
+        valid_fields = {
+            "source_dir",
+            "target_dir",
+            "status",
+            "log_path",
+            "transfer_date",
+            "transfer_time",
+        }
+        for field, value in kwargs.items():
+            if field in valid_fields:
+                set_clauses.append(f"{field} = ?")
+                params.append(value)
+        if not set_clauses:
+            print(f"No valid fields provided for update of run_id: {run_id}")
+            return self
+
+        params.append(run_id)
+        update_query = f"UPDATE run SET {', '.join(set_clauses)} WHERE run_id = ?"
+        with self._write_txn() as conn:
+            cursor = conn.execute(update_query, params)
+        if cursor.rowcount:
+            print(f"Updated record for run_id: {run_id}")
         else:
             print(f"{run_id} does not exist.")
-        conn.close()
         return self
 
     def insert(self, run_id: str, **kwargs):
@@ -177,28 +328,25 @@ class TransferDB:
             db.insert("run123", status="SUCCESS", source_dir="/path/to/source")
             db.insert("run123", transfer_date="09/25/2025", transfer_time="10:30:00")
         """
-        conn = self._connect_db()
-        cursor = conn.execute("SELECT * FROM run WHERE run_id = ?", (run_id,))
-        existing_record = cursor.fetchone()
-
-        if not existing_record:
-            defaults = {
-                "transfer_date": datetime.now().strftime("%m/%d/%Y"),
-                "transfer_time": datetime.now().strftime("%H:%M:%S"),
-                "status": "NA",
-                "source_dir": "NA",
-                "target_dir": "NA",
-                "log_path": "NA",
-            }
-            for key, value in kwargs.items():
-                if key in defaults:
-                    defaults[key] = value
-            insert_query = """
-                INSERT INTO run (run_id, transfer_date, transfer_time, status, 
-                                source_dir, target_dir, log_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-            conn.execute(
+        now = datetime.now()
+        defaults = {
+            "transfer_date": now.strftime("%m/%d/%Y"),
+            "transfer_time": now.strftime("%H:%M:%S"),
+            "status": "NA",
+            "source_dir": "NA",
+            "target_dir": "NA",
+            "log_path": "NA",
+        }
+        for key, value in kwargs.items():
+            if key in defaults:
+                defaults[key] = value
+        insert_query = """
+            INSERT OR IGNORE INTO run (run_id, transfer_date, transfer_time, status,
+                                      source_dir, target_dir, log_path)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """
+        with self._write_txn() as conn:
+            cursor = conn.execute(
                 insert_query,
                 (
                     run_id,
@@ -210,11 +358,10 @@ class TransferDB:
                     defaults["log_path"],
                 ),
             )
-            conn.commit()
+        if cursor.rowcount:
             print(f"Inserted new record for run_id: {run_id}")
         else:
             print(f"{run_id} already exists. Use update() instead.")
-        conn.close()
         return self
 
     def delete(self, run_id):
@@ -229,13 +376,9 @@ class TransferDB:
         Note:
             Prints confirmation message or error if run_id doesn't exist.
         """
-        conn = self._connect_db()
-        cursor = conn.execute("SELECT * FROM run WHERE run_id = ?", (run_id,))
-        existing_record = cursor.fetchone()
-        if existing_record:
-            cursor.execute("DELETE FROM run WHERE run_id = ?", (run_id,))
-            conn.commit()
-            conn.close()
+        with self._write_txn() as conn:
+            cursor = conn.execute("DELETE FROM run WHERE run_id = ?", (run_id,))
+        if cursor.rowcount:
             print(f"{run_id} deleted.")
         else:
             print(f"{run_id} does not exist.")
@@ -244,12 +387,16 @@ class TransferDB:
     def upsert(self, run_id: str, **kwargs):
         """Insert if record doesn't exist, otherwise update existing record.
 
-        This is a convenience method that combines insert and update functionality.
+        Runs in one write transaction: an INSERT ... ON CONFLICT(run_id) DO
+        NOTHING, then, if the record already existed, an UPDATE of the
+        explicitly provided fields. A new record gets the same defaults as
+        insert(); messages match those of insert() and update().
 
         Args:
             run_id (str): Unique identifier for the run record.
-            **kwargs: Keyword arguments passed to insert() or update() methods.
-                     Valid keys: source_dir, target_dir, status, log_path.
+            **kwargs: Keyword arguments for fields to insert or update.
+                     Valid keys: source_dir, target_dir, status, log_path,
+                     transfer_date, transfer_time.
 
         Returns:
             TransferDB: Self reference for method chaining.
@@ -257,14 +404,51 @@ class TransferDB:
         Example:
             db.upsert("run123", status="SUCCESS", source_dir="/path/to/source")
         """
-        conn = self._connect_db()
-        cursor = conn.execute("SELECT * FROM run WHERE run_id = ?", (run_id,))
-        existing_record = cursor.fetchone()
-        conn.close()
-        if existing_record:
-            return self.update(run_id, **kwargs)
+        now = datetime.now()
+        values = {
+            "transfer_date": now.strftime("%m/%d/%Y"),
+            "transfer_time": now.strftime("%H:%M:%S"),
+            "status": "NA",
+            "source_dir": "NA",
+            "target_dir": "NA",
+            "log_path": "NA",
+        }
+        update_fields = [field for field in kwargs if field in values]
+        for field in update_fields:
+            values[field] = kwargs[field]
+        upsert_query = """
+            INSERT INTO run (run_id, transfer_date, transfer_time, status,
+                            source_dir, target_dir, log_path)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(run_id) DO NOTHING
+        """
+        with self._write_txn() as conn:
+            cursor = conn.execute(
+                upsert_query,
+                (
+                    run_id,
+                    values["transfer_date"],
+                    values["transfer_time"],
+                    values["status"],
+                    values["source_dir"],
+                    values["target_dir"],
+                    values["log_path"],
+                ),
+            )
+            inserted = cursor.rowcount == 1
+            if not inserted and update_fields:
+                set_clause = ", ".join(f"{field} = ?" for field in update_fields)
+                conn.execute(
+                    f"UPDATE run SET {set_clause} WHERE run_id = ?",
+                    [kwargs[field] for field in update_fields] + [run_id],
+                )
+        if inserted:
+            print(f"Inserted new record for run_id: {run_id}")
+        elif update_fields:
+            print(f"Updated record for run_id: {run_id}")
         else:
-            return self.insert(run_id, **kwargs)
+            print(f"No valid fields provided for update of run_id: {run_id}")
+        return self
 
 
 def main():
@@ -355,20 +539,20 @@ def main():
     if args.operation == 'query':
         where_conditions = []
         where_clause = None
-        if args.run_id:
-            where_conditions.append(f"run_id='{args.run_id}'")
-        if args.status:
-            where_conditions.append(f"status='{args.status}'")
-        if args.source_dir:
-            where_conditions.append(f"source_dir='{args.source_dir}'")
-        if args.target_dir:
-            where_conditions.append(f"target_dir='{args.target_dir}'")
-        if args.log_path:
-            where_conditions.append(f"log_path='{args.log_path}'")
-        if args.transfer_date:
-            where_conditions.append(f"transfer_date='{args.transfer_date}'")
-        if args.transfer_time:
-            where_conditions.append(f"transfer_time='{args.transfer_time}'")
+        params = []
+        filters = {
+            "run_id": args.run_id,
+            "status": args.status,
+            "source_dir": args.source_dir,
+            "target_dir": args.target_dir,
+            "log_path": args.log_path,
+            "transfer_date": args.transfer_date,
+            "transfer_time": args.transfer_time,
+        }
+        for field, value in filters.items():
+            if value:
+                where_conditions.append(f"{field} = ?")
+                params.append(value)
         if where_conditions:
             where_clause = " AND ".join(where_conditions)
         if args.where:
@@ -381,7 +565,8 @@ def main():
             columns=args.columns,
             limit=args.limit,
             where_clause=where_clause,
-            order_by=args.order_by
+            order_by=args.order_by,
+            params=tuple(params)
         ).show(header=args.header)
 
     elif args.operation == 'insert':
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 
 import argparse
-import sqlite3
 import csv
 import sys
 from pathlib import Path
 
+try:
+    from ._sqlite import connect
+except ImportError:  # run as a script from utils/
+    from _sqlite import connect
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--run-id", help="Show results for specific run ID")
@@ -22,7 +26,7 @@ def main():
         print("No database found.")
         return
     
-    conn = sqlite3.connect(str(db_path))
+    conn = connect(db_path)
     
     where_conditions = []
     params = []
@@ -51,18 +55,18 @@ def main():
     query += " ORDER BY transfer_date DESC, transfer_time DESC"
     
     cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
+    # Peek one row to detect an empty result, then stream the rest
+    first_row = cursor.fetchone()
     
-    if rows:
+    if first_row:
         if args.print_ids:
-            for row in rows:
-                print(row[0])
+            print(first_row[0])
+            sys.stdout.writelines(f"{row[0]}\n" for row in cursor)
         else:
             writer = csv.writer(sys.stdout)
             writer.writerow(["run_id", "transfer_date", "transfer_time", "status", "source_dir", "target_dir"])
-            
-            for row in rows:
-                writer.writerow(row)
+            writer.writerow(first_row)
+            writer.writerows(cursor)
     else:
         if not args.print_ids:
             print("No results found!")